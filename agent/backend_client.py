@@ -3,8 +3,10 @@
 Makes HTTP requests to backend API endpoints for real Google Calendar data.
 """
 
+import asyncio
 import os
 import logging
+import threading
 from typing import List, Dict, Any, Optional
 import httpx
 
@@ -12,6 +14,23 @@ from agent.calendar_client import CalendarClient
 
 logger = logging.getLogger(__name__)
 
+# Tools run each call on a throwaway event loop, so an AsyncClient can't be
+# shared between calls; a thread-safe sync client keeps the connection pool warm.
+_http_client: Optional[httpx.Client] = None
+_http_client_lock = threading.Lock()
+
+
+def _get_http_client() -> httpx.Client:
+    """Get the shared pooled httpx client used for backend API calls."""
+    global _http_client
+    with _http_client_lock:
+        if _http_client is None or _http_client.is_closed:
+            _http_client = httpx.Client(
+                timeout=30.0,
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
+            )
+        return _http_client
+
 
 class BackendClient(CalendarClient):
     """
@@ -81,40 +100,42 @@ class BackendClient(CalendarClient):
             "Content-Type": "application/json",
         }
         
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
+        client = _get_http_client()
+        try:
+            response = await asyncio.to_thread(
+                client.request,
+                method=method,
+                url=url,
+                headers=headers,
+                json=json_data,
+                params=params,
+                timeout=self.timeout,
+            )
+            response.raise_for_status()
+            return response.json()
+        except httpx.HTTPStatusError as e:
+            # Extract error message from response body
+            # FastAPI returns JSON with "detail" field for HTTPException
+            error_message = "Unknown error"
             try:
-                response = await client.request(
-                    method=method,
-                    url=url,
-                    headers=headers,
-                    json=json_data,
-                    params=params,
-                )
-                response.raise_for_status()
-                return response.json()
-            except httpx.HTTPStatusError as e:
-                # Extract error message from response body
-                # FastAPI returns JSON with "detail" field for HTTPException
-                error_message = "Unknown error"
-                try:
-                    error_data = e.response.json()
-                    if isinstance(error_data, dict) and "detail" in error_data:
-                        error_message = str(error_data["detail"])
-                    elif isinstance(error_data, dict) and "message" in error_data:
-                        error_message = str(error_data["message"])
-                    elif e.response.text:
-                        error_message = e.response.text
-                except Exception:
-                    # If we can't parse the error, use response text or status code
-                    error_message = e.response.text or f"Backend API error: {e.response.status_code}"
-                
-                logger.error(
-                    f"Backend API error: {method} {url} - {e.response.status_code}: {error_message}"
-                )
-                raise ValueError(f"Backend API error: {error_message}") from e
-            except httpx.RequestError as e:
-                logger.error(f"Backend API request failed: {method} {url} - {str(e)}")
-                raise ValueError(f"Backend API request failed: {str(e)}") from e
+                error_data = e.response.json()
+                if isinstance(error_data, dict) and "detail" in error_data:
+                    error_message = str(error_data["detail"])
+                elif isinstance(error_data, dict) and "message" in error_data:
+                    error_message = str(error_data["message"])
+                elif e.response.text:
+                    error_message = e.response.text
+            except Exception:
+                # If we can't parse the error, use response text or status code
+                error_message = e.response.text or f"Backend API error: {e.response.status_code}"
+            
+            logger.error(
+                f"Backend API error: {method} {url} - {e.response.status_code}: {error_message}"
+            )
+            raise ValueError(f"Backend API error: {error_message}") from e
+        except httpx.RequestError as e:
+            logger.error(f"Backend API request failed: {method} {url} - {str(e)}")
+            raise ValueError(f"Backend API request failed: {str(e)}") from e
     
     async def read_schedule(
         self,
@@ -12,6 +12,7 @@ if str(_parent_dir) not in sys.path:
     sys.path.insert(0, str(_parent_dir))
 
 import logging
+import re
 import time
 from langgraph.graph import StateGraph, END, START
 from typing_extensions import TypedDict
@@ -20,7 +21,7 @@ from langchain_openai import ChatOpenAI
 from langchain_core.messages import BaseMessage, HumanMessage, AIMessage, ToolMessage, SystemMessage
 
 from agent.tools import ALL_TOOLS, INTERNAL_TOOLS, EXTERNAL_TOOLS, set_auth_context
-from agent.schemas.agent_response import ErrorResponse
+from agent.schemas.agent_response import ErrorResponse, NoActionMetadata, NoActionResponse
 from agent.validation import validate_request
 from agent.timing_logger import log_step, log_start
 from agent.time_reference import generate_time_reference
@@ -36,8 +37,11 @@ openai_api_key = os.getenv("OPENAI_API_KEY")
 if not openai_api_key:
     logger.warning("OPENAI_API_KEY not found in environment variables - LLM calls may fail")
 
+# Overridable so deployments can try a smaller/cheaper model without a code change
+AGENT_MODEL = os.getenv("AGENT_MODEL", "gpt-4o-mini")
+
 llm = ChatOpenAI(
-    model="gpt-4o-mini",
+    model=AGENT_MODEL,
     temperature=0.7,
     model_kwargs={"tool_choice": "required"},  # Force tool usage at model level
 )
@@ -54,6 +58,17 @@ logger.info(f"Tool mapping: {len(TOOL_MAP)} tools total")
 logger.info(f"Internal tools: {INTERNAL_TOOL_NAMES}")
 logger.info(f"External tools: {EXTERNAL_TOOL_NAMES}")
 
+# Prebuilt error payload; error paths only fill in message and query
+_ERROR_RESPONSE_TEMPLATE = ErrorResponse(message="").model_dump()
+
+# Bare greetings/thanks never need calendar data, so they skip the LLM entirely
+_GREETING_RE = re.compile(
+    r"^\s*(hi|hello|hey|thanks|thank you|thx|bye|good (morning|afternoon|evening|night))"
+    r"( there| noon)?\s*[!.?]*\s*$",
+    re.IGNORECASE,
+)
+_GREETING_REASON = "Greeting or acknowledgement; no calendar action requested."
+
 
 # ============================================================================
 # System Prompt Builder Functions
@@ -317,11 +332,25 @@ def _build_examples_section() -> str:
 
 
 
+# Static sections are joined once at import. They come first so OpenAI's
+# automatic prompt caching can reuse the shared prefix across requests;
+# only the time section changes per call and is appended last.
+_STATIC_SYSTEM_PROMPT = "\n\n".join(filter(None, [
+    _build_agent_identity_section(),
+    _build_architecture_section(),
+    _build_tool_reference_section(),  # Includes calendar selection rules for write operations
+    _build_query_patterns_section(),  # Includes calendar selection in CREATE/UPDATE/DELETE patterns
+    _build_tool_result_processing_section(),
+    _build_error_handling_section(),
+    _build_examples_section(),
+]))
+
+
 def _build_system_prompt(
     current_time: str,
     user_timezone: str
 ) -> str:
-    """Assemble complete system prompt from all sections"""
+    """Assemble complete system prompt: cached static sections, then the time section"""
     # Parse ISO string to datetime object
     try:
         current_datetime = datetime.fromisoformat(current_time)
@@ -339,18 +368,8 @@ def _build_system_prompt(
         # This should not happen in normal operation, but provides a fallback
         raise ValueError(f"Invalid current_time format: {current_time}") from e
     
-    sections = [
-        _build_agent_identity_section(),
-        _build_architecture_section(),
-        _build_time_date_handling_section(current_datetime, user_timezone),
-        _build_tool_reference_section(),  # Includes calendar selection rules for write operations
-        _build_query_patterns_section(),  # Includes calendar selection in CREATE/UPDATE/DELETE patterns
-        _build_tool_result_processing_section(),
-        _build_error_handling_section(),
-        _build_examples_section(),
-    ]
-    
-    return "\n\n".join(filter(None, sections))  # Filter out empty sections
+    time_section = _build_time_date_handling_section(current_datetime, user_timezone)
+    return f"{_STATIC_SYSTEM_PROMPT}\n\n{time_section}"
 
 
 # ============================================================================
@@ -393,9 +412,10 @@ class OutputState(TypedDict):
     query: str  # The transcribed text that was passed to the agent
 
 
-def agent_node(state: State) -> Dict[str, Any]:
+async def agent_node(state: State) -> Dict[str, Any]:
     """
     Main agent node that processes queries with LLM and tool calling.
+    Async so the LLM request doesn't hold a worker thread while it waits.
     """
     node_start_time = time.time()
     query = state.get("query", "")
@@ -404,6 +424,18 @@ def agent_node(state: State) -> Dict[str, Any]:
     
     log_start("agent_node", details=f"query_length={len(query)}")
     
+    if not messages and _GREETING_RE.match(query):
+        log_step("agent_node", time.time() - node_start_time, details="fast_path=greeting")
+        return {
+            "success": True,
+            "terminated": True,
+            "tool_results": {
+                "external_tool_result": NoActionResponse(
+                    metadata=NoActionMetadata(reason=_GREETING_REASON)
+                ).model_dump(),
+            },
+        }
+    
     # Get time context from state
     current_time = state.get("current_time")
     user_timezone = state.get("timezone")
@@ -436,7 +468,7 @@ def agent_node(state: State) -> Dict[str, Any]:
     try:
         # Invoke LLM with tools (tool_choice="required" set at model level)
         llm_start_time = time.time()
-        response = llm_with_tools.invoke(messages)
+        response = await llm_with_tools.ainvoke(messages)
         llm_duration = time.time() - llm_start_time
         tool_call_count = len(response.tool_calls) if hasattr(response, 'tool_calls') and response.tool_calls else 0
         log_step("agent_node.llm_invoke", llm_duration, details=f"tool_calls={tool_call_count}")
@@ -816,10 +848,9 @@ def format_response_node(state: State) -> Dict[str, Any]:
     # Check if we have an error
     if not success and message:
         logger.info(f"Returning error response: {message}")
-        error_response = ErrorResponse(message=message, query=query)
         node_duration = time.time() - node_start_time
         log_step("format_response_node", node_duration, details="result=error")
-        return error_response.model_dump()
+        return {**_ERROR_RESPONSE_TEMPLATE, "message": message, "query": query}
     
     # Check if we have an external tool result
     # Tools now return properly formatted response dicts via .model_dump()
@@ -836,13 +867,13 @@ def format_response_node(state: State) -> Dict[str, Any]:
     # Fallback: should not happen if agent is working correctly
     # Return error instead of no-action
     logger.error("No external tool result and no error - this should not happen")
-    error_response = ErrorResponse(
-        message="Agent failed to produce a valid response. No tool was called to handle the query.",
-        query=query
-    )
     node_duration = time.time() - node_start_time
     log_step("format_response_node", node_duration, details="result=fallback_error")
-    return error_response.model_dump()
+    return {
+        **_ERROR_RESPONSE_TEMPLATE,
+        "message": "Agent failed to produce a valid response. No tool was called to handle the query.",
+        "query": query,
+    }
 
 
 def should_continue(state: State) -> str:
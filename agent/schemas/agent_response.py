@@ -2,9 +2,9 @@ from __future__ import annotations
 
 from datetime import date as date_type, datetime
 from enum import StrEnum
-from typing import Annotated, Literal, Optional, Union
+from typing import Annotated, Any, Literal, Optional, Union
 
-from pydantic import BaseModel, Discriminator, Field, field_validator, model_validator, ConfigDict
+from pydantic import BaseModel, Discriminator, Field, Tag, field_validator, model_validator, ConfigDict
 
 
 class AgentResponseType(StrEnum):
@@ -20,18 +20,16 @@ class TimedDateTime(BaseModel):
     """Represents a timed event with specific start/end times."""
     type: Literal["timed"] = "timed"
     dateTime: datetime
-    
-    class Config:
-        populate_by_name = True
+
+    model_config = ConfigDict(populate_by_name=True)
 
 
 class AllDayDateTime(BaseModel):
     """Represents an all-day event with date only."""
     type: Literal["all_day"] = "all_day"
     date: date_type
-    
-    class Config:
-        populate_by_name = True
+
+    model_config = ConfigDict(populate_by_name=True)
 
 
 # Discriminated union for DateTimeDict
@@ -127,14 +125,33 @@ class ErrorResponse(BaseModel):
     query: Optional[str] = None
 
 
-AgentResponse = Union[
-    ShowEventResponse,
-    ShowScheduleResponse,
-    CreateEventResponse,
-    UpdateEventResponse,
-    DeleteEventResponse,
-    NoActionResponse,
-    ErrorResponse,
+def _agent_response_tag(value: Any) -> str:
+    """Pick the AgentResponse variant by type; untyped or failed payloads are errors."""
+    if isinstance(value, dict):
+        success = value.get("success")
+        response_type = value.get("type")
+    else:
+        if isinstance(value, ErrorResponse):
+            return "error"
+        success = getattr(value, "success", None)
+        response_type = getattr(value, "type", None)
+    if success is False or response_type is None:
+        return "error"
+    return str(response_type)
+
+
+# Discriminated union so validation dispatches straight to one model
+AgentResponse = Annotated[
+    Union[
+        Annotated[ShowEventResponse, Tag(AgentResponseType.SHOW_EVENT.value)],
+        Annotated[ShowScheduleResponse, Tag(AgentResponseType.SHOW_SCHEDULE.value)],
+        Annotated[CreateEventResponse, Tag(AgentResponseType.CREATE_EVENT.value)],
+        Annotated[UpdateEventResponse, Tag(AgentResponseType.UPDATE_EVENT.value)],
+        Annotated[DeleteEventResponse, Tag(AgentResponseType.DELETE_EVENT.value)],
+        Annotated[NoActionResponse, Tag(AgentResponseType.NO_ACTION.value)],
+        Annotated[ErrorResponse, Tag("error")],
+    ],
+    Discriminator(_agent_response_tag),
 ]
 
 __all__ = [
@@ -4,10 +4,14 @@ This module provides functions to generate calendar views and relative date
 cheat sheets for inclusion in agent system prompts.
 """
 
-from datetime import datetime, timedelta
+from datetime import date, datetime, time, timedelta
+from functools import lru_cache
 from zoneinfo import ZoneInfo
 import calendar
 
+# End-of-day time used in every date range
+_END_OF_DAY = time(23, 59, 59)
+
 
 def _build_calendar_view(current_datetime: datetime, timezone: str) -> str:
     """Generate a multi-week Gregorian calendar view.
@@ -96,8 +100,7 @@ def _build_relative_dates_cheat_sheet(current_datetime: datetime, timezone: str)
     # Helper function to format date range as ISO strings
     def format_date_range(start_date: datetime.date, end_date: datetime.date) -> str:
         start_dt = datetime.combine(start_date, datetime.min.time()).replace(tzinfo=tz)
-        end_time = datetime.strptime("23:59:59", "%H:%M:%S").time()
-        end_dt = datetime.combine(end_date, end_time).replace(tzinfo=tz)
+        end_dt = datetime.combine(end_date, _END_OF_DAY).replace(tzinfo=tz)
         start_iso = start_dt.isoformat()
         end_iso = end_dt.isoformat()
         return f"({start_iso} to {end_iso})"
@@ -227,6 +230,19 @@ def _build_relative_dates_cheat_sheet(current_datetime: datetime, timezone: str)
     return "\n".join(items)
 
 
+@lru_cache(maxsize=256)
+def _cheat_sheet_for_day(today: date, is_early_morning: bool, timezone: str) -> str:
+    """Build the cheat sheet once per (day, early-morning flag, timezone).
+
+    The sheet only depends on the local date and whether it is before 4 AM,
+    so any representative time with the same flag gives the same output.
+    """
+    representative = datetime.combine(
+        today, time(0 if is_early_morning else 12), tzinfo=ZoneInfo(timezone)
+    )
+    return _build_relative_dates_cheat_sheet(representative, timezone)
+
+
 def generate_time_reference(current_datetime: datetime, timezone: str) -> str:
     """Generate time reference including calendar view and relative dates cheat sheet.
     
@@ -237,7 +253,10 @@ def generate_time_reference(current_datetime: datetime, timezone: str) -> str:
     Returns:
         Formatted string containing calendar view and relative dates cheat sheet
     """
-    calendar_view = _build_calendar_view(current_datetime, timezone)
-    cheat_sheet = _build_relative_dates_cheat_sheet(current_datetime, timezone)
-    
-    return f"{cheat_sheet}"
\ No newline at end of file
+    tz = ZoneInfo(timezone)
+    if current_datetime.tzinfo is None:
+        current_datetime = current_datetime.replace(tzinfo=tz)
+    else:
+        current_datetime = current_datetime.astimezone(tz)
+
+    return _cheat_sheet_for_day(current_datetime.date(), current_datetime.hour < 4, timezone)
@@ -3,6 +3,8 @@
 import logging
 import time
 from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Optional
 from zoneinfo import ZoneInfo
 from urllib.parse import urlparse
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Request, Body
@@ -11,6 +13,7 @@ from langgraph_sdk import get_client
 
 from schemas.agent_response import (
     AgentResponse,
+    AgentResponseType,
     ErrorResponse,
     ShowEventResponse,
     ShowScheduleResponse,
@@ -40,6 +43,28 @@ class AgentActionRequest(BaseModel):
     query: str
 
 
+# Response model for each successful agent response type
+_RESPONSE_MODELS = {
+    AgentResponseType.SHOW_EVENT: ShowEventResponse,
+    AgentResponseType.SHOW_SCHEDULE: ShowScheduleResponse,
+    AgentResponseType.CREATE_EVENT: CreateEventResponse,
+    AgentResponseType.UPDATE_EVENT: UpdateEventResponse,
+    AgentResponseType.DELETE_EVENT: DeleteEventResponse,
+    AgentResponseType.NO_ACTION: NoActionResponse,
+}
+
+
+@lru_cache(maxsize=4)
+def _get_langgraph_client(url: str, api_key: Optional[str]):
+    """Get a cached LangGraph SDK client so its HTTP pool is reused across requests."""
+    return get_client(url=url, api_key=api_key)
+
+
+def _error_response(message: str) -> dict:
+    """Build an ErrorResponse-shaped dict without a pydantic round-trip."""
+    return {"success": False, "message": message, "query": None}
+
+
 @router.post("/transcribe")
 async def transcribe_audio(
     file: UploadFile = File(..., description="Audio file to transcribe"),
@@ -162,14 +187,11 @@ async def agent_action(
                 detail="Agent service is not configured with LangSmith authentication credentials."
             )
 
-        client = get_client(
-            url=settings.langgraph_agent_url,
-            api_key=api_key,
-        )
+        client = _get_langgraph_client(settings.langgraph_agent_url, api_key)
 
         # Get user timezone from users table
         timezone_start = time.time()
-        user_timezone = get_user_timezone(current_user.id)
+        user_timezone = await get_user_timezone(current_user.id)
         timezone_duration = time.time() - timezone_start
         log_step("backend.api.action.get_timezone", timezone_duration)
         
@@ -227,30 +249,19 @@ async def agent_action(
             elif "type" in result:
                 # Success response - parse based on type
                 response_type = result.get("type")
-                if response_type == "show-event":
-                    response = ShowEventResponse.model_validate(result)
-                elif response_type == "show-schedule":
-                    response = ShowScheduleResponse.model_validate(result)
-                elif response_type == "create-event":
-                    response = CreateEventResponse.model_validate(result)
-                elif response_type == "update-event":
-                    response = UpdateEventResponse.model_validate(result)
-                elif response_type == "delete-event":
-                    response = DeleteEventResponse.model_validate(result)
-                elif response_type == "no-action":
-                    response = NoActionResponse.model_validate(result)
-                else:
+                response_model = _RESPONSE_MODELS.get(response_type)
+                if response_model is None:
                     logger.warning(
                         f"Unknown response type user_id={current_user.id} type={response_type}"
                     )
-                    error_response = ErrorResponse(
-                        message=f"Unknown response type from agent: {response_type}"
-                    )
                     parse_duration = time.time() - parse_start
                     log_step("backend.api.action.parse_response", parse_duration, details=f"result=unknown_type type={response_type}")
                     endpoint_duration = time.time() - endpoint_start
                     log_step("backend.api.action", endpoint_duration)
-                    return error_response.model_dump()
+                    return _error_response(
+                        f"Unknown response type from agent: {response_type}"
+                    )
+                response = response_model.model_validate(result)
                 parse_duration = time.time() - parse_start
                 log_step("backend.api.action.parse_response", parse_duration, details=f"result=success type={response_type}")
                 endpoint_duration = time.time() - endpoint_start
@@ -264,15 +275,14 @@ async def agent_action(
                     f"Unexpected result format user_id={current_user.id} "
                     f"keys={list(result.keys())}"
                 )
-                # Return brief, user-friendly message (not technical details)
-                error_response = ErrorResponse(
-                    message="Agent failed to handle request precisely. Please try rephrasing your request."
-                )
                 parse_duration = time.time() - parse_start
                 log_step("backend.api.action.parse_response", parse_duration, details="result=unexpected_format")
                 endpoint_duration = time.time() - endpoint_start
                 log_step("backend.api.action", endpoint_duration)
-                return error_response.model_dump()
+                # Return brief, user-friendly message (not technical details)
+                return _error_response(
+                    "Agent failed to handle request precisely. Please try rephrasing your request."
+                )
         except ValidationError as e:
             # This is an agent mistake (invalid response format), not a user error
             # Log full details for debugging (verbose internal logging)
@@ -280,13 +290,12 @@ async def agent_action(
                 f"Response validation failed user_id={current_user.id}: {e}",
                 exc_info=True,
             )
-            # Return brief, user-friendly message (not technical details)
-            error_response = ErrorResponse(
-                message="Agent failed to handle request precisely. Please try rephrasing your request."
-            )
             endpoint_duration = time.time() - endpoint_start
             log_step("backend.api.action", endpoint_duration, details="result=validation_error")
-            return error_response.model_dump()
+            # Return brief, user-friendly message (not technical details)
+            return _error_response(
+                "Agent failed to handle request precisely. Please try rephrasing your request."
+            )
 
     except HTTPException:
         endpoint_duration = time.time() - endpoint_start
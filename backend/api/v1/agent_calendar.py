@@ -12,6 +12,7 @@ from typing import List, Dict, Any
 from zoneinfo import ZoneInfo
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import ORJSONResponse
 
 from core.dependencies import AuthenticatedUser, get_current_user, get_user_timezone
 from domains.calendars.service import CalendarService
@@ -32,9 +33,8 @@ router = APIRouter(prefix="/agent/calendars", tags=["agent-calendars"])
 def _parse_datetime_or_date(dt_str: str) -> datetime:
     """Parse ISO datetime string, handling both date-only and datetime formats."""
     try:
-        # Handle Z suffix and timezone offsets
-        normalized = dt_str.replace("Z", "+00:00")
-        return datetime.fromisoformat(normalized)
+        # fromisoformat accepts the Z suffix and offsets on Python 3.11+
+        return datetime.fromisoformat(dt_str)
     except Exception as e:
         logger.error(f"Failed to parse datetime: {dt_str} - {e}")
         raise ValueError(f"Invalid datetime format: {dt_str}") from e
@@ -130,7 +130,7 @@ async def get_schedule(
         end_date = date.fromisoformat(end_date_str)
         
         # Get user timezone
-        user_timezone = get_user_timezone(current_user.id)
+        user_timezone = await get_user_timezone(current_user.id)
         
         # Use CalendarService which aggregates across ALL calendars
         service = CalendarService()
@@ -203,11 +203,11 @@ async def get_schedule(
         ) from e
 
 
-@router.post("/search")
+@router.post("/search", response_class=ORJSONResponse)
 async def search_events(
     payload: Dict[str, Any],
     current_user: AuthenticatedUser = Depends(get_current_user),
-) -> Dict[str, Any]:
+) -> ORJSONResponse:
     """
     Search for events across ALL calendars matching keywords.
     
@@ -277,7 +277,8 @@ async def search_events(
                 "location": event.get("location"),
             })
         
-        return {"events": formatted_events}
+        # Serialize directly with orjson, skipping jsonable_encoder
+        return ORJSONResponse({"events": formatted_events})
         
     except HTTPException:
         raise
@@ -8,7 +8,7 @@ from datetime import datetime, timezone
 from typing import Any, Dict
 
 from fastapi import APIRouter, Depends, HTTPException, Response, status
-from fastapi.responses import RedirectResponse
+from fastapi.responses import ORJSONResponse, RedirectResponse
 
 from core.dependencies import AuthenticatedUser, get_current_user, get_user_timezone
 from core.timing_logger import log_step, log_start
@@ -18,6 +18,7 @@ from domains.calendars.schemas import (
     GoogleOAuthStartResponse,
     CalendarResponse,
     CalendarUpdate,
+    EventWindowInfo,
     ScheduleRequest,
     ScheduleResponse,
     CreateEventRequest,
@@ -26,6 +27,7 @@ from domains.calendars.schemas import (
     UpdateEventRequest,
     UpdateEventResponse,
 )
+from domains.calendars import cache as calendar_cache
 from domains.calendars.service import CalendarService
 from domains.calendars.repository import CalendarRepository
 from domains.calendars.providers.google import (
@@ -61,17 +63,14 @@ async def list_accounts(
     """List all Google accounts for the current user with their calendars."""
     repository = CalendarRepository()
     try:
-        account_rows = repository.get_accounts(current_user.id)
+        # Calendars come embedded, including hidden ones so users can toggle visibility
+        account_rows = repository.get_accounts_with_calendars(current_user.id)
         accounts = []
         for account_row in account_rows:
-            account_id = account_row["id"]
-            # Fetch calendars for this account - include hidden calendars so users can toggle visibility
-            calendar_rows = repository.get_calendars_by_account(account_id, include_hidden=True)
-            calendars = [CalendarResponse(**cal) for cal in calendar_rows] if calendar_rows else []
+            calendar_rows = account_row.pop("calendars", None) or []
+            calendars = [CalendarResponse(**cal) for cal in calendar_rows]
             # Create account response with calendars
-            account_dict = dict(account_row)
-            account_dict["calendars"] = calendars
-            accounts.append(GoogleAccountResponse(**account_dict))
+            accounts.append(GoogleAccountResponse(**account_row, calendars=calendars))
     except SupabaseStorageError as exc:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(exc)
@@ -96,6 +95,7 @@ async def refresh_calendars(
     try:
         service_start = time.time()
         await service.hydrate_calendars(current_user.id)
+        calendar_cache.invalidate_user_cache(current_user.id)
         service_duration = time.time() - service_start
         log_step("backend.api.calendars.refresh_calendars.service", service_duration)
         
@@ -211,7 +211,8 @@ async def oauth_callback(state: str, code: str) -> RedirectResponse:
     try:
         account = repository.upsert_account(user_id, payload)
         account_id = account["id"]
-        repository.sync_calendars(account_id, calendars)
+        repository.sync_calendars(account_id, calendars, user_id)
+        calendar_cache.invalidate_user_cache(user_id)
     except SupabaseStorageError as exc:
         logger.error("Failed to persist Google account for user %s: %s", user_id, exc)
         redirect_url = build_app_redirect_url(
@@ -238,6 +239,7 @@ async def create_account(
         row = repository.upsert_account(
             current_user.id, payload.model_dump(exclude_none=True)
         )
+        calendar_cache.invalidate_user_cache(current_user.id)
     except SupabaseStorageError as exc:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)
@@ -255,6 +257,7 @@ async def delete_account(
     repository = CalendarRepository()
     try:
         repository.delete_account(current_user.id, account_id)
+        calendar_cache.invalidate_user_cache(current_user.id)
     except SupabaseStorageError as exc:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)
@@ -277,6 +280,7 @@ async def update_calendar(
             calendar_id,
             payload.model_dump(exclude_none=True),
         )
+        calendar_cache.invalidate_user_cache(current_user.id)
     except SupabaseStorageError as exc:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)
@@ -290,13 +294,13 @@ async def update_calendar(
 async def get_schedule(
     payload: ScheduleRequest,
     current_user: AuthenticatedUser = Depends(get_current_user),
-) -> ScheduleResponse:
+) -> ORJSONResponse:
     """Get schedule for a date range."""
     endpoint_start = time.time()
     log_start("backend.api.calendars.schedule", details=f"user_id={current_user.id} start={payload.start_date} end={payload.end_date}")
     
     # Get user timezone from database
-    user_timezone = get_user_timezone(current_user.id)
+    user_timezone = await get_user_timezone(current_user.id)
     
     service = CalendarService()
     try:
@@ -311,13 +315,18 @@ async def get_schedule(
         log_step("backend.api.calendars.schedule.service", service_duration, details=f"event_count={len(result.get('events', []))}")
         
         response_start = time.time()
-        response = ScheduleResponse(**result)
+        # Events come straight from Google, so skip re-validating each one
+        response = ScheduleResponse.model_construct(
+            window=EventWindowInfo(**result["window"]),
+            events=[CalendarEvent.from_google(event) for event in result["events"]],
+        )
         response_duration = time.time() - response_start
         log_step("backend.api.calendars.schedule.build_response", response_duration)
         
         endpoint_duration = time.time() - endpoint_start
         log_step("backend.api.calendars.schedule", endpoint_duration, details=f"event_count={len(result.get('events', []))}")
-        return response
+        # Returned as a Response so FastAPI doesn't dump and re-validate it against response_model
+        return ORJSONResponse(response.model_dump(mode="json"))
     except GoogleCalendarUserError as exc:
         raise HTTPException(status_code=exc.status_code, detail=str(exc)) from exc
     except GoogleCalendarAuthError as exc:
@@ -339,7 +348,7 @@ async def create_event(
 ) -> CreateEventResponse:
     """Create a new event in Google Calendar."""
     # Get user timezone from database
-    user_timezone = get_user_timezone(current_user.id)
+    user_timezone = await get_user_timezone(current_user.id)
     
     service = CalendarService()
     try:
@@ -449,7 +458,7 @@ async def update_event(
 ) -> UpdateEventResponse:
     """Update an existing event in Google Calendar."""
     # Get user timezone from database
-    user_timezone = get_user_timezone(current_user.id)
+    user_timezone = await get_user_timezone(current_user.id)
     
     service = CalendarService()
     try:
@@ -10,13 +10,20 @@ from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
 from domains.auth.repository import AuthRepository
-from db.session import get_service_client
+from db.session import get_async_service_client
 from utils.errors import SupabaseAuthError, SupabaseStorageError
 
 security = HTTPBearer()
 logger = logging.getLogger(__name__)
 
 
+def _as_datetime(value: datetime | str) -> datetime:
+    """Parse an ISO timestamp from Supabase, passing datetimes through."""
+    if isinstance(value, datetime):
+        return value
+    return datetime.fromisoformat(value)
+
+
 async def get_current_user(
     request: Request,
     credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)],
@@ -63,12 +70,12 @@ async def get_current_user(
     return AuthenticatedUser(
         id=user["id"],
         phone=user["phone"],
-        created_at=user["created_at"],
-        updated_at=user["updated_at"],
+        created_at=_as_datetime(user["created_at"]),
+        updated_at=_as_datetime(user["updated_at"]),
     )
 
 
-def get_user_timezone(user_id: str) -> str:
+async def get_user_timezone(user_id: str) -> str:
     """
     Get user's timezone from database.
     
@@ -88,9 +95,9 @@ def get_user_timezone(user_id: str) -> str:
     Raises:
         HTTPException: If timezone not found, invalid, or not configured
     """
-    supabase_client = get_service_client()
+    supabase_client = await get_async_service_client()
     try:
-        user_result = (
+        user_result = await (
             supabase_client.table("users")
             .select("timezone")
             .eq("id", user_id)
@@ -2,15 +2,45 @@
 
 from __future__ import annotations
 
+import asyncio
 from functools import lru_cache
 
-from supabase import Client, create_client
+from supabase import AsyncClient, Client, acreate_client, create_client
 
 from core.config import get_settings
 
+_async_service_client: AsyncClient | None = None
+_async_service_client_lock = asyncio.Lock()
+
 
 @lru_cache
 def get_service_client() -> Client:
     """Get cached Supabase service client."""
     settings = get_settings()
     return create_client(settings.supabase_url, settings.supabase_service_role_key)
+
+
+async def get_async_service_client() -> AsyncClient:
+    """Get cached async Supabase service client for per-request hot paths.
+
+    Queries through this client don't block the event loop, and its
+    connection pool is reused across requests.
+    """
+    global _async_service_client
+    if _async_service_client is None:
+        # Concurrent first requests must not each build (and leak) a client
+        async with _async_service_client_lock:
+            if _async_service_client is None:
+                settings = get_settings()
+                _async_service_client = await acreate_client(
+                    settings.supabase_url, settings.supabase_service_role_key
+                )
+    return _async_service_client
+
+
+async def close_async_service_client() -> None:
+    """Close the async Supabase client's connections (called on application shutdown)."""
+    global _async_service_client
+    if _async_service_client is not None:
+        await _async_service_client.postgrest.aclose()
+        _async_service_client = None
@@ -6,7 +6,7 @@ from typing import Any, Dict, Tuple
 
 from postgrest import APIError
 
-from db.session import get_service_client
+from db.session import get_async_service_client, get_service_client
 from utils.errors import SupabaseAuthError, SupabaseStorageError
 
 
@@ -122,9 +122,9 @@ class AuthRepository:
             raise SupabaseAuthError(f"Invalid token: {str(exc)}") from exc
 
         # Fetch user from database
-        client = get_service_client()
+        client = await get_async_service_client()
         try:
-            result = client.table("users").select("*").eq("id", user_id).execute()
+            result = await client.table("users").select("*").eq("id", user_id).execute()
         except APIError as exc:
             # Check if the error is related to JWT expiration
             # Supabase may return JWT errors even with service role key if RLS is checking
@@ -0,0 +1,73 @@
+"""Short-lived per-user caches for the Supabase account and calendar lookups."""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from domains.calendars.repository import CalendarRepository
+
+CACHE_TTL_SECONDS = 60.0
+CACHE_MAX_USERS = 10_000
+
+_accounts_cache: Dict[str, Tuple[float, List[Dict[str, Any]]]] = {}
+_calendars_cache: Dict[str, Tuple[float, List[Dict[str, Any]]]] = {}
+# Lookups run in worker threads via asyncio.to_thread, so guard every access
+_cache_lock = threading.Lock()
+
+
+def _cache_get(
+    cache: Dict[str, Tuple[float, List[Dict[str, Any]]]], user_id: str
+) -> Optional[List[Dict[str, Any]]]:
+    """Return a cached value if present and not expired."""
+    with _cache_lock:
+        entry = cache.get(user_id)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            cache.pop(user_id, None)
+            return None
+        return value
+
+
+def _cache_set(
+    cache: Dict[str, Tuple[float, List[Dict[str, Any]]]],
+    user_id: str,
+    value: List[Dict[str, Any]],
+) -> None:
+    """Store a value, evicting the oldest entry when the cache is full."""
+    with _cache_lock:
+        if user_id not in cache and len(cache) >= CACHE_MAX_USERS:
+            cache.pop(next(iter(cache)), None)
+        cache[user_id] = (time.monotonic() + CACHE_TTL_SECONDS, value)
+
+
+def get_accounts(
+    user_id: str, repository: CalendarRepository | None = None
+) -> List[Dict[str, Any]]:
+    """Get the user's Google accounts, served from cache when fresh."""
+    accounts = _cache_get(_accounts_cache, user_id)
+    if accounts is None:
+        accounts = (repository or CalendarRepository()).get_accounts(user_id)
+        _cache_set(_accounts_cache, user_id, accounts)
+    return accounts
+
+
+def get_calendars(
+    user_id: str, repository: CalendarRepository | None = None
+) -> List[Dict[str, Any]]:
+    """Get the user's visible calendars, served from cache when fresh."""
+    calendars = _cache_get(_calendars_cache, user_id)
+    if calendars is None:
+        calendars = (repository or CalendarRepository()).get_calendars(user_id)
+        _cache_set(_calendars_cache, user_id, calendars)
+    return calendars
+
+
+def invalidate_user_cache(user_id: str) -> None:
+    """Drop cached accounts and calendars after they change for a user."""
+    with _cache_lock:
+        _accounts_cache.pop(user_id, None)
+        _calendars_cache.pop(user_id, None)
@@ -3,18 +3,22 @@
 from __future__ import annotations
 
 import asyncio
+import random
 import secrets
 import time
 from dataclasses import dataclass
+from functools import lru_cache
 from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional
 from urllib.parse import quote, urlencode
 
 import httpx
 import jwt
+import orjson
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
-from googleapiclient.discovery import build
+from googleapiclient.discovery import build, build_from_document
+from googleapiclient.discovery_cache import get_static_doc
 from googleapiclient.errors import HttpError
 
 from core.config import get_settings
@@ -38,7 +42,69 @@ STATE_AUDIENCE = "google-oauth-state"
 TOKEN_ENDPOINT = "https://oauth2.googleapis.com/token"
 USERINFO_ENDPOINT = "https://www.googleapis.com/oauth2/v2/userinfo"
 CALENDAR_LIST_ENDPOINT = "https://www.googleapis.com/calendar/v3/users/me/calendarList"
+CALENDAR_LIST_FIELDS = (
+    "items(id,summary,primary,accessRole,backgroundColor,foregroundColor)"
+)
 API_BASE_URL = "https://www.googleapis.com/calendar/v3"
+# Google caps a single batch HTTP request at 50 sub-requests
+BATCH_MAX_REQUESTS = 50
+# Largest events.list page Google allows; full-window listings page through
+# everything, so bigger pages mean fewer sequential round-trips
+EVENTS_PAGE_SIZE = 2500
+
+# Retries for rate-limited (429) or transient Google API failures
+GOOGLE_API_NUM_RETRIES = 3
+GOOGLE_API_MAX_BACKOFF_SECONDS = 32.0
+RATE_LIMIT_REASONS = ("rateLimitExceeded", "userRateLimitExceeded")
+
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get the shared httpx client used for Google OAuth and REST calls."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            http2=True,
+            timeout=15.0,
+            limits=httpx.Limits(max_keepalive_connections=64, max_connections=128),
+        )
+    return _http_client
+
+
+@lru_cache(maxsize=1)
+def _calendar_discovery_document() -> Optional[str]:
+    """Load the bundled Calendar v3 discovery document once per process.
+
+    Built services are not shared because their httplib2 transport is not
+    thread-safe; only the static document read is cached.
+    """
+    return get_static_doc("calendar", "v3")
+
+
+def _is_rate_limited(result: Any) -> bool:
+    """Check whether a batch sub-result is a Google rate-limit error."""
+    if not isinstance(result, GoogleCalendarAPIError):
+        return False
+    if result.status_code == 429:
+        return True
+    payload_text = str(result.payload)
+    return result.status_code == 403 and any(
+        reason in payload_text for reason in RATE_LIMIT_REASONS
+    )
+
+
+def _backoff_delay(attempt: int) -> float:
+    """Exponential backoff with full jitter, capped."""
+    return random.uniform(0, min(GOOGLE_API_MAX_BACKOFF_SECONDS, 2.0 ** (attempt + 1)))
+
+
+async def close_http_client() -> None:
+    """Close the shared httpx client (called on application shutdown)."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
 
 
 @dataclass(frozen=True)
@@ -131,8 +197,7 @@ class GoogleCalendarAPIError(RuntimeError):
                 error.content.decode() if hasattr(error, "content") else None
             )
             if payload:
-                import json
-                payload = json.loads(payload)
+                payload = orjson.loads(payload)
         except (ValueError, AttributeError):
             payload = str(error)
         return cls(
@@ -200,7 +265,7 @@ class GoogleCalendarHttpClient:
             )
         
         parse_start = time.time()
-        result = response.json()
+        result = orjson.loads(response.content)
         parse_duration = time.time() - parse_start
         log_step("backend.google_calendar_api.request.parse", parse_duration)
         
@@ -226,7 +291,7 @@ class GoogleCalendarHttpClient:
         calendar_id: str,
         time_min: str,
         time_max: str,
-        max_results: int = 250,
+        max_results: int = EVENTS_PAGE_SIZE,
     ) -> List[Dict[str, Any]]:
         """List events from a calendar."""
         method_start = time.time()
@@ -303,7 +368,7 @@ def _encode_path_segment(segment: str) -> str:
 def _safe_json(response: httpx.Response) -> Any:
     """Safely parse JSON from response."""
     try:
-        return response.json()
+        return orjson.loads(response.content)
     except ValueError:
         return response.text
 
@@ -344,7 +409,7 @@ class GoogleCalendarProvider(CalendarProvider):
         calendar_id: str,
         time_min: Optional[str] = None,
         time_max: Optional[str] = None,
-        max_results: int = 250,
+        max_results: int = EVENTS_PAGE_SIZE,
     ) -> Dict[str, Any]:
         """List events from a calendar."""
         method_start = time.time()
@@ -371,6 +436,20 @@ class GoogleCalendarProvider(CalendarProvider):
         
         return {"items": result} if isinstance(result, list) else result
 
+    async def batch_list_events(
+        self,
+        calendar_ids: List[str],
+        time_min: Optional[str] = None,
+        time_max: Optional[str] = None,
+    ) -> Dict[str, List[Dict[str, Any]] | GoogleCalendarAPIError]:
+        """List events for several calendars of this account in batch requests."""
+        wrapper = self._get_wrapper()
+        return await wrapper.batch_list_events(
+            calendar_ids=calendar_ids,
+            time_min=time_min,
+            time_max=time_max,
+        )
+
     async def get_event(
         self,
         calendar_id: str,
@@ -454,15 +533,23 @@ class GoogleCalendarWrapper:
                 self.credentials.access_token = creds.token
                 if creds.refresh_token:
                     self.credentials.refresh_token = creds.refresh_token
-            self._service = build("calendar", "v3", credentials=creds)
+            document = _calendar_discovery_document()
+            if document is None:
+                self._service = build("calendar", "v3", credentials=creds)
+            else:
+                self._service = build_from_document(document, credentials=creds)
         return self._service
 
-    async def _execute_request(self, request):
-        """Execute a Google API request asynchronously."""
+    async def _execute_request(self, request, *, num_retries: int = 0):
+        """Execute a Google API request asynchronously.
+
+        Reads pass num_retries so the client backs off with jitter on
+        429/5xx; writes keep the default of 0 to avoid duplicate inserts.
+        """
         execute_start = time.time()
         log_start("backend.google_calendar_wrapper._execute_request")
         try:
-            result = await asyncio.to_thread(request.execute)
+            result = await asyncio.to_thread(request.execute, num_retries=num_retries)
             execute_duration = time.time() - execute_start
             log_step("backend.google_calendar_wrapper._execute_request", execute_duration)
             return result
@@ -480,7 +567,9 @@ class GoogleCalendarWrapper:
         """Get a single event from a calendar."""
         service = self._get_service()
         request = service.events().get(calendarId=calendar_id, eventId=event_id)
-        return await self._execute_request(request)
+        return await self._execute_request(
+            request, num_retries=GOOGLE_API_NUM_RETRIES
+        )
 
     async def list_events(
         self,
@@ -488,7 +577,7 @@ class GoogleCalendarWrapper:
         calendar_id: str,
         time_min: Optional[str] = None,
         time_max: Optional[str] = None,
-        max_results: int = 250,
+        max_results: int = EVENTS_PAGE_SIZE,
         page_token: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
         """List events from a calendar."""
@@ -517,7 +606,9 @@ class GoogleCalendarWrapper:
             log_step(f"backend.google_calendar_wrapper.list_events.build_request.page_{page_num}", request_duration)
             
             execute_start = time.time()
-            result = await self._execute_request(request)
+            result = await self._execute_request(
+                request, num_retries=GOOGLE_API_NUM_RETRIES
+            )
             execute_duration = time.time() - execute_start
             items = result.get("items", [])
             if isinstance(items, list):
@@ -555,7 +646,156 @@ class GoogleCalendarWrapper:
         if time_max:
             params["timeMax"] = time_max
         request = service.events().list(**params)
-        return await self._execute_request(request)
+        return await self._execute_request(
+            request, num_retries=GOOGLE_API_NUM_RETRIES
+        )
+
+    async def _batch_events_list(
+        self,
+        calendar_ids: List[str],
+        params: Dict[str, Any],
+    ) -> Dict[str, Dict[str, Any] | GoogleCalendarAPIError]:
+        """Run events.list with the same params for many calendars in batch requests.
+
+        Sends one batch HTTP request per 50 calendars and retries only the
+        sub-requests Google rate limited, with backoff.
+
+        Returns:
+            Mapping of calendar ID to its events.list result, or to the
+            GoogleCalendarAPIError raised for that calendar.
+        """
+        service = self._get_service()
+        results: Dict[str, Dict[str, Any] | GoogleCalendarAPIError] = {}
+
+        def handle_response(request_id: str, response: Any, exception: Any) -> None:
+            if exception is None:
+                results[request_id] = response
+            elif isinstance(exception, HttpError):
+                results[request_id] = GoogleCalendarAPIError.from_http_error(exception)
+            else:
+                results[request_id] = GoogleCalendarAPIError(
+                    str(exception), status_code=500, payload=None
+                )
+
+        pending = list(calendar_ids)
+        for attempt in range(GOOGLE_API_NUM_RETRIES + 1):
+            for offset in range(0, len(pending), BATCH_MAX_REQUESTS):
+                batch = service.new_batch_http_request(callback=handle_response)
+                for cal_id in pending[offset:offset + BATCH_MAX_REQUESTS]:
+                    batch.add(
+                        service.events().list(calendarId=cal_id, **params),
+                        request_id=cal_id,
+                    )
+                try:
+                    await asyncio.to_thread(batch.execute)
+                except HttpError as error:
+                    raise GoogleCalendarAPIError.from_http_error(error) from error
+
+            pending = [
+                cal_id for cal_id in pending
+                if _is_rate_limited(results.get(cal_id))
+            ]
+            if not pending or attempt == GOOGLE_API_NUM_RETRIES:
+                break
+            delay = _backoff_delay(attempt)
+            logger.warning(
+                "Google rate limited %d events.list calls, retrying in %.2fs",
+                len(pending),
+                delay,
+            )
+            await asyncio.sleep(delay)
+
+        return results
+
+    async def batch_search_events(
+        self,
+        *,
+        query: str,
+        calendar_ids: List[str],
+        time_min: Optional[str] = None,
+        time_max: Optional[str] = None,
+        max_results: int = 250,
+    ) -> Dict[str, Dict[str, Any] | GoogleCalendarAPIError]:
+        """Search several calendars with one batch HTTP request per 50 calendars.
+
+        Returns:
+            Mapping of calendar ID to its events.list result, or to the
+            GoogleCalendarAPIError raised for that calendar.
+        """
+        method_start = time.time()
+        log_start("backend.google_calendar_wrapper.batch_search_events", details=f"calendars={len(calendar_ids)}")
+
+        params: Dict[str, Any] = {
+            "q": query,
+            "maxResults": max_results,
+            "singleEvents": True,
+            "orderBy": "startTime",
+        }
+        if time_min:
+            params["timeMin"] = time_min
+        if time_max:
+            params["timeMax"] = time_max
+        results = await self._batch_events_list(calendar_ids, params)
+
+        method_duration = time.time() - method_start
+        log_step("backend.google_calendar_wrapper.batch_search_events", method_duration, details=f"calendars={len(calendar_ids)}")
+        return results
+
+    async def batch_list_events(
+        self,
+        *,
+        calendar_ids: List[str],
+        time_min: Optional[str] = None,
+        time_max: Optional[str] = None,
+    ) -> Dict[str, List[Dict[str, Any]] | GoogleCalendarAPIError]:
+        """List every event in a window for several calendars using batch requests.
+
+        The first page of each calendar comes back in one batch round-trip;
+        the rare calendar with more pages is followed up individually.
+
+        Returns:
+            Mapping of calendar ID to its events, or to the
+            GoogleCalendarAPIError raised for that calendar.
+        """
+        method_start = time.time()
+        log_start("backend.google_calendar_wrapper.batch_list_events", details=f"calendars={len(calendar_ids)}")
+
+        params: Dict[str, Any] = {
+            "maxResults": EVENTS_PAGE_SIZE,
+            "singleEvents": True,
+            "orderBy": "startTime",
+        }
+        if time_min:
+            params["timeMin"] = time_min
+        if time_max:
+            params["timeMax"] = time_max
+        first_pages = await self._batch_events_list(calendar_ids, params)
+
+        results: Dict[str, List[Dict[str, Any]] | GoogleCalendarAPIError] = {}
+        for cal_id, page in first_pages.items():
+            if isinstance(page, GoogleCalendarAPIError):
+                results[cal_id] = page
+                continue
+            events = list(page.get("items") or [])
+            page_token = page.get("nextPageToken")
+            if page_token:
+                try:
+                    events.extend(
+                        await self.list_events(
+                            calendar_id=cal_id,
+                            time_min=time_min,
+                            time_max=time_max,
+                            page_token=page_token,
+                        )
+                    )
+                except GoogleCalendarAPIError as exc:
+                    results[cal_id] = exc
+                    continue
+            results[cal_id] = events
+
+        method_duration = time.time() - method_start
+        log_step("backend.google_calendar_wrapper.batch_list_events", method_duration, details=f"calendars={len(calendar_ids)}")
+        return results
 
     async def create_event(
         self,
@@ -606,7 +846,9 @@ class GoogleCalendarWrapper:
             request = service.calendarList().list(
                 minAccessRole=min_access_role, pageToken=page_token
             )
-            result = await self._execute_request(request)
+            result = await self._execute_request(
+                request, num_retries=GOOGLE_API_NUM_RETRIES
+            )
             items = result.get("items", [])
             if isinstance(items, list):
                 calendars.extend(items)
@@ -686,17 +928,17 @@ async def exchange_code_for_tokens(code: str) -> GoogleTokens:
         "grant_type": "authorization_code",
         "redirect_uri": settings.google_oauth_redirect_uri_resolved,
     }
-    async with httpx.AsyncClient(timeout=15.0) as client:
-        response = await client.post(
-            TOKEN_ENDPOINT, data=payload, headers={"Accept": "application/json"}
-        )
+    client = get_http_client()
+    response = await client.post(
+        TOKEN_ENDPOINT, data=payload, headers={"Accept": "application/json"}
+    )
     if response.status_code != httpx.codes.OK:
         error_text = response.text
         logger.error("Token exchange failed: status=%d error=%s", response.status_code, error_text)
         raise GoogleOAuthError(
             f"Token exchange failed with status {response.status_code}: {error_text}"
         )
-    data = response.json()
+    data = orjson.loads(response.content)
     access_token = data.get("access_token")
     if not access_token:
         raise GoogleOAuthError(
@@ -732,15 +974,15 @@ async def refresh_access_token(refresh_token: str) -> GoogleTokens:
         "refresh_token": refresh_token,
         "grant_type": "refresh_token",
     }
-    async with httpx.AsyncClient(timeout=15.0) as client:
-        response = await client.post(
-            TOKEN_ENDPOINT, data=payload, headers={"Accept": "application/json"}
-        )
+    client = get_http_client()
+    response = await client.post(
+        TOKEN_ENDPOINT, data=payload, headers={"Accept": "application/json"}
+    )
     if response.status_code != httpx.codes.OK:
         error_text = response.text
         error_data = None
         try:
-            error_data = response.json()
+            error_data = orjson.loads(response.content)
         except (ValueError, KeyError):
             pass
         
@@ -761,7 +1003,7 @@ async def refresh_access_token(refresh_token: str) -> GoogleTokens:
         raise GoogleOAuthError(
             f"Token refresh failed with status {response.status_code}: {error_text}"
         )
-    data = response.json()
+    data = orjson.loads(response.content)
     access_token = data.get("access_token")
     if not access_token:
         raise GoogleOAuthError(
@@ -781,13 +1023,13 @@ async def refresh_access_token(refresh_token: str) -> GoogleTokens:
 async def fetch_profile(access_token: str) -> GoogleProfile:
     """Fetch Google user profile."""
     headers = {"Authorization": f"Bearer {access_token}", "Accept": "application/json"}
-    async with httpx.AsyncClient(timeout=15.0) as client:
-        response = await client.get(USERINFO_ENDPOINT, headers=headers)
+    client = get_http_client()
+    response = await client.get(USERINFO_ENDPOINT, headers=headers)
     if response.status_code != httpx.codes.OK:
         raise GoogleOAuthError(
             f"Failed to load Google profile: {response.status_code} {response.text}"
         )
-    data = response.json()
+    data = orjson.loads(response.content)
     profile_id = data.get("id") or data.get("sub")
     email = data.get("email")
     if not profile_id or not email:
@@ -804,30 +1046,29 @@ async def fetch_profile(access_token: str) -> GoogleProfile:
 async def fetch_calendar_list(access_token: str) -> List[Dict[str, Any]]:
     """Fetch list of Google calendars."""
     headers = {"Authorization": f"Bearer {access_token}", "Accept": "application/json"}
-    params = {"minAccessRole": "reader"}
-    async with httpx.AsyncClient(timeout=15.0) as client:
-        response = await client.get(
-            CALENDAR_LIST_ENDPOINT, headers=headers, params=params
-        )
+    # Partial response: only request the fields we keep so Google sends a
+    # fraction of the full calendarList body.
+    params = {"minAccessRole": "reader", "fields": CALENDAR_LIST_FIELDS}
+    client = get_http_client()
+    response = await client.get(
+        CALENDAR_LIST_ENDPOINT, headers=headers, params=params
+    )
     if response.status_code != httpx.codes.OK:
         raise GoogleOAuthError(
             f"Failed to load Google calendars: {response.status_code} {response.text}"
         )
-    data = response.json()
-    items = data.get("items") or []
-    sanitized: List[Dict[str, Any]] = []
-    for item in items:
-        sanitized.append(
-            {
-                "id": item.get("id"),
-                "summary": item.get("summary"),
-                "primary": item.get("primary", False),
-                "access_role": item.get("accessRole"),
-                "background_color": item.get("backgroundColor"),
-                "foreground_color": item.get("foregroundColor"),
-            }
-        )
-    return sanitized
+    items = orjson.loads(response.content).get("items") or []
+    return [
+        {
+            "id": item.get("id"),
+            "summary": item.get("summary"),
+            "primary": item.get("primary", False),
+            "access_role": item.get("accessRole"),
+            "background_color": item.get("backgroundColor"),
+            "foreground_color": item.get("foregroundColor"),
+        }
+        for item in items
+    ]
 
 
 def build_app_redirect_url(
@@ -30,6 +30,31 @@ class CalendarRepository:
             raise SupabaseStorageError(exc.message) from exc
         return result.data or []
 
+    def get_accounts_with_calendars(self, user_id: str) -> List[Dict[str, Any]]:
+        """
+        Get all Google accounts for a user with their calendars embedded.
+
+        Uses PostgREST resource embedding so accounts and calendars (including
+        hidden ones) come back in a single round-trip.
+
+        Args:
+            user_id: User ID
+
+        Returns:
+            List of account dictionaries, each with a "calendars" list
+        """
+        client = get_service_client()
+        try:
+            result = (
+                client.table("google_accounts")
+                .select("*, calendars(*)")
+                .eq("user_id", user_id)
+                .execute()
+            )
+        except APIError as exc:
+            raise SupabaseStorageError(exc.message) from exc
+        return result.data or []
+
     def get_calendars(self, user_id: str, include_hidden: bool = False) -> List[Dict[str, Any]]:
         """
         Get all calendars for a user from the database.
@@ -76,6 +101,23 @@ class CalendarRepository:
             raise SupabaseStorageError(exc.message) from exc
         return result.data or []
 
+    def calendar_visible(self, user_id: str, google_calendar_id: str) -> bool:
+        """Check whether a user has a non-hidden calendar with this Google ID."""
+        client = get_service_client()
+        try:
+            result = (
+                client.table("calendars")
+                .select("id")
+                .eq("user_id", user_id)
+                .eq("google_calendar_id", google_calendar_id)
+                .eq("is_hidden", False)
+                .limit(1)
+                .execute()
+            )
+        except APIError as exc:
+            raise SupabaseStorageError(exc.message) from exc
+        return bool(result.data)
+
     async def get_account(self, user_id: str) -> Dict[str, Any] | None:
         """
         Get the first Google account for a user.
@@ -176,7 +218,12 @@ class CalendarRepository:
         except APIError as exc:
             raise SupabaseStorageError(f"Failed to clear calendars: {exc.message}") from exc
 
-    def sync_calendars(self, google_account_id: str, calendars: Iterable[Dict[str, Any]]) -> None:
+    def sync_calendars(
+        self,
+        google_account_id: str,
+        calendars: Iterable[Dict[str, Any]],
+        user_id: str | None = None,
+    ) -> None:
         """
         Upsert Google calendars for the account and remove stale entries.
 
@@ -189,24 +236,26 @@ class CalendarRepository:
                 - accessRole (str): Google Calendar access role ("reader", "writer", "owner")
                 - backgroundColor (str | None): Hex color provided by Google (camelCase)
                 - foregroundColor (str | None): Hex color provided by Google (camelCase)
+            user_id: Owning user ID, if known; skips the account lookup round-trip
         """
-        # Fetch the account to get user_id for RLS
         client = get_service_client()
-        try:
-            account_result = (
-                client.table("google_accounts")
-                .select("user_id")
-                .eq("id", google_account_id)
-                .limit(1)
-                .execute()
-            )
-        except APIError as exc:
-            raise SupabaseStorageError(exc.message) from exc
-        
-        if not account_result.data:
-            raise SupabaseStorageError(f"Google account {google_account_id} not found.")
-        
-        user_id = account_result.data[0]["user_id"]
+        if user_id is None:
+            # Fetch the account to get user_id for RLS
+            try:
+                account_result = (
+                    client.table("google_accounts")
+                    .select("user_id")
+                    .eq("id", google_account_id)
+                    .limit(1)
+                    .execute()
+                )
+            except APIError as exc:
+                raise SupabaseStorageError(exc.message) from exc
+
+            if not account_result.data:
+                raise SupabaseStorageError(f"Google account {google_account_id} not found.")
+
+            user_id = account_result.data[0]["user_id"]
 
         # Get existing calendars to preserve is_hidden values
         try:
@@ -5,7 +5,7 @@ from __future__ import annotations
 from datetime import date, datetime
 from typing import Annotated, Any, Dict, List, Literal, Optional, Union
 
-from pydantic import BaseModel, Discriminator, Field, HttpUrl, Tag, model_serializer, model_validator
+from pydantic import BaseModel, ConfigDict, Discriminator, Field, HttpUrl, Tag, model_serializer, model_validator
 
 
 # Google Account schemas
@@ -81,18 +81,16 @@ class TimedEventTime(BaseModel):
     type: Literal["timed"] = "timed"
     date_time: datetime = Field(..., alias="dateTime")
     time_zone: Optional[str] = Field(None, alias="timeZone")
-    
-    class Config:
-        populate_by_name = True
+
+    model_config = ConfigDict(populate_by_name=True)
 
 
 class AllDayEventTime(BaseModel):
     """Represents an all-day event with date only."""
     type: Literal["all_day"] = "all_day"
     date: date
-    
-    class Config:
-        populate_by_name = True
+
+    model_config = ConfigDict(populate_by_name=True)
 
 
 # Discriminated union for event times
@@ -110,6 +108,33 @@ class EventWindowInfo(BaseModel):
     end_date: date
 
 
+def _parse_google_event_time(value: Any) -> Any:
+    """Convert a Google start/end dict to EventTime field values; pass others through."""
+    if not isinstance(value, dict) or "type" in value:
+        return value
+    if "dateTime" in value:
+        # Timed event - parse datetime string
+        date_time = value["dateTime"]
+        if isinstance(date_time, str):
+            # fromisoformat accepts the Z suffix and offsets on Python 3.11+
+            date_time = datetime.fromisoformat(date_time)
+        return {
+            "type": "timed",
+            "date_time": date_time,  # Use snake_case field name (alias will handle "dateTime" in JSON)
+            "time_zone": value.get("timeZone"),  # Use snake_case field name
+        }
+    if "date" in value:
+        # All-day event - parse date string
+        date_value = value["date"]
+        if isinstance(date_value, str):
+            date_value = date.fromisoformat(date_value)
+        return {
+            "type": "all_day",
+            "date": date_value,
+        }
+    return value
+
+
 class CalendarEvent(BaseModel):
     id: Optional[str] = None
     summary: Optional[str] = None
@@ -133,64 +158,28 @@ class CalendarEvent(BaseModel):
     def parse_event_times(cls, data: Any) -> Any:
         """Parse start/end from Google Calendar API format to EventTime union."""
         if isinstance(data, dict):
-            # Parse start
-            if "start" in data and isinstance(data["start"], dict) and "type" not in data["start"]:
-                start_dict = data["start"]
-                if "dateTime" in start_dict:
-                    # Timed event - parse datetime string
-                    date_time_str = start_dict["dateTime"]
-                    # Parse ISO format datetime
-                    if isinstance(date_time_str, str):
-                        # Handle Z suffix and timezone
-                        normalized = date_time_str.replace("Z", "+00:00")
-                        date_time = datetime.fromisoformat(normalized)
-                    else:
-                        date_time = date_time_str
-                    data["start"] = {
-                        "type": "timed",
-                        "date_time": date_time,  # Use snake_case field name (alias will handle "dateTime" in JSON)
-                        "time_zone": start_dict.get("timeZone"),  # Use snake_case field name
-                    }
-                elif "date" in start_dict:
-                    # All-day event - parse date string
-                    date_str = start_dict["date"]
-                    if isinstance(date_str, str):
-                        date_value = date.fromisoformat(date_str)
-                    else:
-                        date_value = date_str
-                    data["start"] = {
-                        "type": "all_day",
-                        "date": date_value,
-                    }
-            
-            # Parse end
-            if "end" in data and isinstance(data["end"], dict) and "type" not in data["end"]:
-                end_dict = data["end"]
-                if "dateTime" in end_dict:
-                    # Timed event - parse datetime string
-                    date_time_str = end_dict["dateTime"]
-                    if isinstance(date_time_str, str):
-                        normalized = date_time_str.replace("Z", "+00:00")
-                        date_time = datetime.fromisoformat(normalized)
-                    else:
-                        date_time = date_time_str
-                    data["end"] = {
-                        "type": "timed",
-                        "date_time": date_time,  # Use snake_case field name (alias will handle "dateTime" in JSON)
-                        "time_zone": end_dict.get("timeZone"),  # Use snake_case field name
-                    }
-                elif "date" in end_dict:
-                    # All-day event - parse date string
-                    date_str = end_dict["date"]
-                    if isinstance(date_str, str):
-                        date_value = date.fromisoformat(date_str)
-                    else:
-                        date_value = date_str
-                    data["end"] = {
-                        "type": "all_day",
-                        "date": date_value,
-                    }
+            for key in ("start", "end"):
+                if key in data:
+                    data[key] = _parse_google_event_time(data[key])
         return data
+
+    @classmethod
+    def from_google(cls, data: Dict[str, Any]) -> "CalendarEvent":
+        """
+        Build an event from a trusted Google Calendar payload without validation.
+
+        Only start/end are converted (into EventTime models, as the validator
+        would); every other field is taken as-is. Use for event dicts built by
+        CalendarService from Google responses, not for user input.
+        """
+        values = {key: data[key] for key in cls.model_fields if key in data}
+        for key in ("start", "end"):
+            parsed = _parse_google_event_time(values.get(key))
+            if isinstance(parsed, dict) and parsed.get("type") == "timed":
+                values[key] = TimedEventTime.model_construct(**parsed)
+            elif isinstance(parsed, dict) and parsed.get("type") == "all_day":
+                values[key] = AllDayEventTime.model_construct(**parsed)
+        return cls.model_construct(**values)
     
     @model_serializer
     def serialize_model(self) -> Dict[str, Any]:
@@ -5,11 +5,14 @@ from __future__ import annotations
 import asyncio
 import logging
 import time as time_module
+from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import date, datetime, time, timedelta, timezone
-from typing import Any, Dict, List, Tuple
+from functools import lru_cache
+from typing import Any, DefaultDict, Dict, List, Set, Tuple
 from zoneinfo import ZoneInfo
 
+from domains.calendars import cache as calendar_cache
 from domains.calendars.providers.base import CalendarProvider
 from core.timing_logger import log_step, log_start
 from domains.calendars.providers.google import (
@@ -42,6 +45,14 @@ PROACTIVE_REFRESH_INTERVAL = timedelta(days=30)  # 30 days
 
 logger = logging.getLogger(__name__)
 
+# Token refreshes are single-flight per account across service instances.
+# Locks are dropped once no caller holds or waits on them, and recent results
+# only live for TOKEN_REFRESH_LEEWAY, so neither map grows per account forever.
+_refresh_locks: Dict[str, asyncio.Lock] = {}
+_refresh_lock_users: DefaultDict[str, int] = defaultdict(int)
+_recent_refreshes: Dict[str, Tuple[datetime, Dict[str, Any]]] = {}
+_background_refreshes: Set[asyncio.Task] = set()
+
 
 @dataclass
 class AccountContext:
@@ -620,13 +631,15 @@ class CalendarService:
         log_start("backend.calendar_service._prepare_context", details=f"user_id={user_id}")
         
         repo_start = time_module.time()
-        accounts = self.repository.get_accounts(user_id)
+        accounts, user_calendars = await asyncio.gather(
+            asyncio.to_thread(calendar_cache.get_accounts, user_id, self.repository),
+            asyncio.to_thread(calendar_cache.get_calendars, user_id, self.repository),
+        )
         if not accounts:
             raise GoogleCalendarUserError(
                 "Link a Google account before requesting calendar data."
             )
 
-        user_calendars = self.repository.get_calendars(user_id)
         repo_duration = time_module.time() - repo_start
         log_step("backend.calendar_service._prepare_context.repository", repo_duration, details=f"accounts={len(accounts)} calendars={len(user_calendars)}")
         
@@ -662,25 +675,27 @@ class CalendarService:
         """Build account contexts with providers.
         
         Skips accounts with invalid/revoked refresh tokens and continues with valid ones.
-        If all accounts are invalid, raises an error.
+        If all accounts are invalid, raises an error. Token refreshes for
+        different accounts run in parallel.
         """
-        contexts: List[AccountContext] = []
-        invalid_accounts: List[str] = []
-        
-        for account in accounts:
+        async def build_single_context(account: Dict[str, Any]) -> AccountContext | None:
             account_email = account.get("email", "unknown")
             try:
                 access_token = await self._ensure_access_token(account)
-                provider = GoogleCalendarProvider(
-                    access_token=access_token,
-                    refresh_token=account.get("refresh_token", ""),
-                )
-                contexts.append(
-                    AccountContext(account=account, access_token=access_token, provider=provider)
-                )
             except GoogleCalendarAuthError as exc:
-                invalid_accounts.append(account_email)
                 logger.warning("Skipping account %s: %s", account_email, str(exc))
+                return None
+            provider = GoogleCalendarProvider(
+                access_token=access_token,
+                refresh_token=account.get("refresh_token", ""),
+            )
+            return AccountContext(account=account, access_token=access_token, provider=provider)
+
+        results = await asyncio.gather(
+            *[build_single_context(account) for account in accounts]
+        )
+        contexts: List[AccountContext] = [ctx for ctx in results if ctx is not None]
+        invalid_count = len(accounts) - len(contexts)
         
         if not contexts and accounts:
             account_emails = [acc.get("email", "unknown") for acc in accounts]
@@ -689,10 +704,10 @@ class CalendarService:
                 "Please re-link at least one Google Calendar account in the app settings."
             )
         
-        if invalid_accounts:
+        if invalid_count:
             logger.info(
                 "Skipped %d invalid account(s), using %d valid account(s)",
-                len(invalid_accounts),
+                invalid_count,
                 len(contexts),
             )
         
@@ -854,7 +869,9 @@ class CalendarService:
                 if account_id:
                     try:
                         sync_start = time_module.time()
-                        self.repository.sync_calendars(account_id, calendars)
+                        await asyncio.to_thread(
+                            self.repository.sync_calendars, account_id, calendars, context.user_id
+                        )
                         sync_duration = time_module.time() - sync_start
                         log_step(f"backend.calendar_service._hydrate_calendars.sync_calendars.context_{idx}", sync_duration)
                         logger.debug(
@@ -887,7 +904,9 @@ class CalendarService:
                         account_id = context.id
                         if account_id:
                             try:
-                                self.repository.sync_calendars(account_id, calendars)
+                                await asyncio.to_thread(
+                                    self.repository.sync_calendars, account_id, calendars, context.user_id
+                                )
                                 logger.debug(
                                     "Synced %d calendars to Supabase for account_id=%s account=%s (after retry)",
                                     len(calendars),
@@ -954,8 +973,9 @@ class CalendarService:
     ) -> List[Dict[str, Any]]:
         """Collect events within a time window.
         
-        Queries all calendars in parallel for maximum performance. Each query uses
-        a fresh provider instance to avoid thread-safety issues with googleapiclient
+        Lists each account's calendars in batched requests (one round-trip per
+        50 calendars) and queries accounts in parallel. Each account uses a fresh
+        provider instance to avoid thread-safety issues with googleapiclient
         (which uses C extensions that aren't thread-safe for concurrent access).
         
         Args:
@@ -973,66 +993,79 @@ class CalendarService:
         method_start = time_module.time()
         log_start("backend.calendar_service._collect_events_within_window", details=f"contexts={len(contexts)}")
         
-        # Collect all calendars to query across all accounts
-        calendar_queries: List[Tuple[Dict[str, Any], AccountContext, str]] = []
+        # Collect the calendars to query, grouped by account
+        queries_by_account: List[List[Tuple[Dict[str, Any], AccountContext, str]]] = []
         for context in contexts:
-            for calendar in context.calendars:
-                calendar_id = calendar.get("id")
-                if not calendar_id:
-                    continue
-                calendar_queries.append((calendar, context, calendar_id))
+            account_queries = [
+                (calendar, context, calendar["id"])
+                for calendar in context.calendars
+                if calendar.get("id")
+            ]
+            if account_queries:
+                queries_by_account.append(account_queries)
         
-        total_calendars = len(calendar_queries)
+        total_calendars = sum(len(queries) for queries in queries_by_account)
         log_start("backend.calendar_service._collect_events_within_window.parallel_queries", details=f"calendar_count={total_calendars} accounts={len(contexts)}")
         
-        async def query_single_calendar(
-            calendar: Dict[str, Any], 
-            context: AccountContext, 
-            calendar_id: str
-        ) -> Tuple[str, List[Dict[str, Any]], AccountContext, Dict[str, Any]]:
-            """Query a single calendar and return results.
+        async def query_account(
+            account_queries: List[Tuple[Dict[str, Any], AccountContext, str]],
+        ) -> List[Tuple[str, List[Dict[str, Any]], AccountContext, Dict[str, Any]]]:
+            """Query all of one account's calendars with batched events.list requests.
             
-            Creates a fresh provider instance for thread-safety. While this creates
-            more provider instances than strictly necessary (one per calendar vs one
-            per account), it's required because googleapiclient's service objects
-            are not thread-safe when accessed concurrently via asyncio.to_thread().
+            Uses a fresh provider per account for thread-safety: googleapiclient's
+            service objects are not thread-safe, and accounts are queried
+            concurrently via asyncio.to_thread().
             
             Returns:
-                Tuple of (calendar_id, items, context, calendar_dict)
+                List of (calendar_id, items, context, calendar_dict) tuples
             """
+            context = account_queries[0][1]
+            fresh_provider = GoogleCalendarProvider(
+                access_token=context.access_token,
+                refresh_token=context.account.get("refresh_token", ""),
+            )
             try:
-                # Create fresh provider for thread-safety (googleapiclient is not thread-safe)
-                # Note: We could reuse context.provider if queries were sequential, but
-                # parallel execution requires separate instances to avoid memory corruption
-                fresh_provider = GoogleCalendarProvider(
-                    access_token=context.access_token,
-                    refresh_token=context.account.get("refresh_token", ""),
-                )
-                result = await fresh_provider.list_events(
-                    calendar_id=calendar_id,
+                listed = await fresh_provider.batch_list_events(
+                    [calendar_id for _, _, calendar_id in account_queries],
                     time_min=time_min_utc,
                     time_max=time_max_utc,
                 )
-                items = result.get("items", []) if isinstance(result, dict) else result
-                return (calendar_id, items, context, calendar)
             except GoogleCalendarAPIError as exc:
                 if exc.status_code in {401, 403, 404}:
-                    # Return empty items for calendars we can't access (permissions, not found, etc.)
-                    return (calendar_id, [], context, calendar)
+                    return [(cal_id, [], ctx, cal) for cal, ctx, cal_id in account_queries]
                 raise GoogleCalendarServiceError(
-                    f"Failed to list events from Google for calendar {calendar_id}."
+                    f"Failed to list events from Google for account {context.email or context.id}."
                 ) from exc
+
+            account_results = []
+            for calendar, _, calendar_id in account_queries:
+                items = listed.get(calendar_id, [])
+                if isinstance(items, GoogleCalendarAPIError):
+                    if items.status_code not in {401, 403, 404}:
+                        logger.warning("Failed to query calendar %s: %s", calendar_id, items)
+                        continue
+                    # Empty items for calendars we can't access (permissions, not found, etc.)
+                    items = []
+                account_results.append((calendar_id, items, context, calendar))
+            return account_results
         
-        # Execute all calendar queries in parallel
+        # Execute one batched query per account, all accounts in parallel
         parallel_start = time_module.time()
-        results = await asyncio.gather(
-            *[query_single_calendar(cal, ctx, cal_id) for cal, ctx, cal_id in calendar_queries],
+        account_results = await asyncio.gather(
+            *[query_account(queries) for queries in queries_by_account],
             return_exceptions=True
         )
+        results: List[Any] = []
+        for account_result in account_results:
+            if isinstance(account_result, Exception):
+                results.append(account_result)
+            else:
+                results.extend(account_result)
         parallel_duration = time_module.time() - parallel_start
         log_step("backend.calendar_service._collect_events_within_window.parallel_queries", parallel_duration, details=f"calendar_count={total_calendars}")
         
         # Process results and filter events within the time window
+        window_tz = ZoneInfo(timezone_name)
         events: List[Dict[str, Any]] = []
         for result in results:
             if isinstance(result, Exception):
@@ -1047,7 +1080,7 @@ class CalendarService:
                 # Filter events to only those within the local time window
                 if not _event_within_window(
                     item,
-                    timezone_name,
+                    window_tz,
                     window_start_local,
                     window_end_local,
                 ):
@@ -1094,50 +1127,101 @@ class CalendarService:
             except (GoogleCalendarServiceError, ValueError, TypeError):
                 last_refresh = None
         
-        # Determine if refresh is needed
-        needs_refresh = False
         if not access_token_valid:
-            needs_refresh = True
-        elif last_refresh is None:
-            needs_refresh = True
-        elif now - last_refresh > PROACTIVE_REFRESH_INTERVAL:
-            needs_refresh = True
-        
-        if not needs_refresh:
-            return access_token
+            return await self._refresh_account_tokens(account)
+
+        if last_refresh is None or now - last_refresh > PROACTIVE_REFRESH_INTERVAL:
+            # Current token still works; keep the refresh token alive off the hot path
+            task = asyncio.create_task(self._proactive_refresh(account))
+            _background_refreshes.add(task)
+            task.add_done_callback(_background_refreshes.discard)
+
+        return access_token
 
-        # Refresh the token
+    async def _proactive_refresh(self, account: Dict[str, Any]) -> None:
+        """Run a keep-alive token refresh in the background, logging failures."""
+        try:
+            await self._refresh_account_tokens(account)
+        except Exception as exc:
+            logger.warning(
+                "Background token refresh failed for account %s: %s",
+                account.get("id"),
+                exc,
+            )
+
+    async def _refresh_account_tokens(self, account: Dict[str, Any]) -> str:
+        """Refresh the account's access token, at most once per account at a time.
+
+        Concurrent callers for the same account wait on a shared lock; the first
+        one refreshes and the rest reuse its result instead of hitting Google again.
+        """
         refresh_token = account.get("refresh_token")
         if not refresh_token:
             raise GoogleCalendarAuthError(
                 f"Google account {account.get('email') or account.get('id')} has no refresh token. Please re-link your Google Calendar account."
             )
 
+        account_id = account["id"]
+        lock = _refresh_locks.setdefault(account_id, asyncio.Lock())
+        _refresh_lock_users[account_id] += 1
         try:
-            tokens = await refresh_access_token(refresh_token)
-            expires = tokens.expires_at()
-            expires_at_str = expires.isoformat() if isinstance(expires, datetime) else expires
-            updated_metadata = _merge_metadata(
-                metadata,
-                {"last_token_refresh_at": now.isoformat()},
-            )
-            updated = self.repository.update_account_tokens(
-                account["user_id"],
-                account["id"],
-                access_token=tokens.access_token,
-                refresh_token=tokens.refresh_token or refresh_token,
-                expires_at=expires_at_str,
-                metadata=updated_metadata,
-            )
-            account.update(updated)
-            return updated["access_token"]
-        except GoogleCalendarAuthError as exc:
-            # Refresh token is invalid/revoked - re-raise to be handled by caller
-            raise
+            async with lock:
+                return await self._refresh_account_tokens_locked(account, refresh_token)
+        finally:
+            _refresh_lock_users[account_id] -= 1
+            if not _refresh_lock_users[account_id]:
+                del _refresh_lock_users[account_id]
+                _refresh_locks.pop(account_id, None)
+
+    async def _refresh_account_tokens_locked(
+        self, account: Dict[str, Any], refresh_token: str
+    ) -> str:
+        """Refresh tokens while holding the account's refresh lock."""
+        account_id = account["id"]
+        now = datetime.now(timezone.utc)
+        recent = _recent_refreshes.get(account_id)
+        if recent is not None:
+            refreshed_at, updated = recent
+            recent_expires = updated.get("expires_at")
+            if (
+                now - refreshed_at < TOKEN_REFRESH_LEEWAY
+                and recent_expires
+                and _parse_datetime(recent_expires) > now + TOKEN_REFRESH_LEEWAY
+            ):
+                account.update(updated)
+                return updated["access_token"]
+
+        metadata = account.get("metadata") or {}
+        tokens = await refresh_access_token(refresh_token)
+        expires = tokens.expires_at()
+        expires_at_str = expires.isoformat() if isinstance(expires, datetime) else expires
+        updated_metadata = _merge_metadata(
+            metadata,
+            {"last_token_refresh_at": now.isoformat()},
+        )
+        updated = self.repository.update_account_tokens(
+            account["user_id"],
+            account_id,
+            access_token=tokens.access_token,
+            refresh_token=tokens.refresh_token or refresh_token,
+            expires_at=expires_at_str,
+            metadata=updated_metadata,
+        )
+        _recent_refreshes[account_id] = (now, updated)
+        # Don't keep a copy of the tokens around past the reuse window
+        asyncio.get_running_loop().call_later(
+            TOKEN_REFRESH_LEEWAY.total_seconds(),
+            _expire_recent_refresh,
+            account_id,
+            now,
+        )
+        account.update(updated)
+        return updated["access_token"]
 
     async def _handle_unauthorized(self, context: AccountContext) -> None:
         """Handle unauthorized error by refreshing token."""
-        refreshed_token = await self._ensure_access_token(context.account)
+        # Google rejected the token, so refresh inline even if expires_at looks fine
+        refreshed_token = await self._refresh_account_tokens(context.account)
         context.access_token = refreshed_token
         # Recreate provider with new token
         context.provider = GoogleCalendarProvider(
@@ -1202,6 +1286,22 @@ def _localize_event_time(
     raise GoogleCalendarServiceError("Event payload is missing start or end time.")
 
 
+def _expire_recent_refresh(account_id: str, refreshed_at: datetime) -> None:
+    """Forget a cached refresh result unless a newer refresh replaced it."""
+    recent = _recent_refreshes.get(account_id)
+    if recent is not None and recent[0] == refreshed_at:
+        del _recent_refreshes[account_id]
+
+
+@lru_cache(maxsize=4096)
+def _parse_iso_datetime(value: str) -> datetime:
+    """Parse an ISO datetime string as an aware datetime (UTC if naive)."""
+    dt = datetime.fromisoformat(value)
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt
+
+
 def _parse_datetime(value: Any) -> datetime:
     """Parse datetime value."""
     if isinstance(value, datetime):
@@ -1209,11 +1309,7 @@ def _parse_datetime(value: Any) -> datetime:
             return value.replace(tzinfo=timezone.utc)
         return value
     if isinstance(value, str):
-        normalized = value.replace("Z", "+00:00")
-        dt = datetime.fromisoformat(normalized)
-        if dt.tzinfo is None:
-            dt = dt.replace(tzinfo=timezone.utc)
-        return dt
+        return _parse_iso_datetime(value)
     raise GoogleCalendarServiceError("Invalid datetime payload from Google Calendar.")
 
 
@@ -1241,12 +1337,11 @@ def _merge_metadata(
 
 def _event_within_window(
     payload: Dict[str, Any],
-    timezone_name: str,
+    tz: ZoneInfo,
     window_start_local: datetime,
     window_end_local: datetime,
 ) -> bool:
     """Check if event is within window."""
-    tz = ZoneInfo(timezone_name)
     try:
         start_dt, start_all_day = _localize_event_time(payload.get("start") or {}, tz)
         end_dt, end_all_day = _localize_event_time(payload.get("end") or {}, tz)
@@ -3,9 +3,10 @@ Voice-to-natural-language transcription service using Deepgram.
 Provides a class-based interface for transcribing audio files with optional custom vocabulary support.
 """
 
+import asyncio
 import io
 from pathlib import Path
-from typing import Optional, List, Tuple, Union, BinaryIO
+from typing import AsyncIterator, Optional, List, Tuple, Union, BinaryIO
 import logging
 import httpx
 
@@ -14,6 +15,18 @@ from core.timing_logger import log_step
 
 logger = logging.getLogger(__name__)
 
+MAX_AUDIO_BYTES = 25 * 1024 * 1024
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+
+async def _iter_file_chunks(file: BinaryIO) -> AsyncIterator[bytes]:
+    """Yield the rest of a file in chunks, reading off the event loop."""
+    while True:
+        chunk = await asyncio.to_thread(file.read, UPLOAD_CHUNK_SIZE)
+        if not chunk:
+            break
+        yield chunk
+
 
 class TranscriptionService:
     """
@@ -131,36 +144,46 @@ class TranscriptionService:
                 "Deepgram API key not configured. Please set DEEPGRAM_API_KEY or pass api_key to __init__."
             )
 
-        # Read audio bytes from various input types
-        audio_bytes: bytes
+        # Resolve the audio source without buffering seekable files in memory
+        audio_bytes: Optional[bytes] = None
+        audio_stream: Optional[BinaryIO] = None
+        audio_path: Optional[Path] = None
+        audio_size: int
         actual_filename: str
 
         if isinstance(file, (str, Path)):
-            # File path
-            file_path = Path(file)
-            if not file_path.exists():
-                raise FileNotFoundError(f"Audio file not found: {file_path}")
-            actual_filename = file_path.name
-            with open(file_path, "rb") as f:
-                audio_bytes = f.read()
+            # File path - streamed from disk below
+            audio_path = Path(file)
+            if not audio_path.exists():
+                raise FileNotFoundError(f"Audio file not found: {audio_path}")
+            actual_filename = audio_path.name
+            audio_size = audio_path.stat().st_size
         elif isinstance(file, bytes):
             # Bytes object
             audio_bytes = file
+            audio_size = len(file)
             actual_filename = filename or "audio.wav"
         elif isinstance(file, io.IOBase):
-            # File-like object
-            audio_bytes = file.read()
+            # File-like object (e.g. an UploadFile's spooled temp file)
             actual_filename = filename or getattr(file, "name", "audio.wav")
+            if file.seekable():
+                position = file.tell()
+                audio_size = file.seek(0, io.SEEK_END) - position
+                file.seek(position)
+                audio_stream = file
+            else:
+                audio_bytes = file.read()
+                audio_size = len(audio_bytes)
         else:
             raise TypeError(
                 f"Unsupported file type: {type(file)}. Expected str, Path, bytes, or file-like object."
             )
 
-        if not audio_bytes:
+        if not audio_size:
             raise ValueError("Empty file")
 
         # Validate file size (25 MB limit to mirror prior behavior)
-        if len(audio_bytes) > 25 * 1024 * 1024:
+        if audio_size > MAX_AUDIO_BYTES:
             raise ValueError("File size exceeds 25 MB limit")
 
         # Determine MIME type
@@ -185,21 +208,32 @@ class TranscriptionService:
         headers = {
             "Authorization": f"Token {self.api_key}",
             "Content-Type": content_type,
+            # Known up front, so streamed bodies aren't sent chunked
+            "Content-Length": str(audio_size),
         }
 
         import time
         deepgram_start_time = time.time()
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            resp = await client.post(
-                "https://api.deepgram.com/v1/listen",
-                params=params,
-                headers=headers,
-                content=audio_bytes,
-            )
-            resp.raise_for_status()
-            payload = resp.json()
+        opened_file = open(audio_path, "rb") if audio_path is not None else None
+        try:
+            if audio_bytes is not None:
+                content: Union[bytes, AsyncIterator[bytes]] = audio_bytes
+            else:
+                content = _iter_file_chunks(opened_file or audio_stream)
+            async with httpx.AsyncClient(timeout=60.0) as client:
+                resp = await client.post(
+                    "https://api.deepgram.com/v1/listen",
+                    params=params,
+                    headers=headers,
+                    content=content,
+                )
+                resp.raise_for_status()
+                payload = resp.json()
+        finally:
+            if opened_file is not None:
+                opened_file.close()
         deepgram_duration = time.time() - deepgram_start_time
-        log_step("backend.transcription_service.deepgram_api", deepgram_duration, details=f"audio_size={len(audio_bytes)} bytes")
+        log_step("backend.transcription_service.deepgram_api", deepgram_duration, details=f"audio_size={audio_size} bytes")
 
         extract_start_time = time.time()
         text = self._extract_transcript_from_deepgram(payload)
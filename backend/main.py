@@ -10,6 +10,8 @@ from fastapi.middleware.cors import CORSMiddleware
 from api.v1.router import router as v1_router
 from core.logging import setup_logging, get_logger
 from core.middleware import RequestLoggingMiddleware
+from db.session import close_async_service_client
+from domains.calendars.providers.google import close_http_client
 
 # Configure centralized logging
 setup_logging()
@@ -22,6 +24,8 @@ async def lifespan(app: FastAPI):
     logger.info("Starting Noon backend API...")
     yield
     logger.info("Shutting down Noon backend API...")
+    await close_http_client()
+    await close_async_service_client()
 
 
 # Create FastAPI application
@@ -1,11 +1,14 @@
-from pydantic import BaseModel, ConfigDict, Field
+from dataclasses import dataclass
 from datetime import datetime
 
 
-class AuthenticatedUser(BaseModel):
-    """Represents an authenticated user."""
+@dataclass(frozen=True)
+class AuthenticatedUser:
+    """Represents an authenticated user.
 
-    model_config = ConfigDict(populate_by_name=True, extra="forbid")
+    Built once per authenticated request, so this is a plain frozen
+    dataclass rather than a validated pydantic model.
+    """
 
     id: str
     phone: str
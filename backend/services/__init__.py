@@ -1,5 +1,17 @@
 """Services module exports."""
 
-from . import agent_calendar_service
+from __future__ import annotations
+
+import importlib
+from typing import Any
 
 __all__ = ["agent_calendar_service"]
+
+
+def __getattr__(name: str) -> Any:
+    """Lazily import service submodules so importing the package stays cheap."""
+    if name in __all__:
+        module = importlib.import_module(f"{__name__}.{name}")
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
+import heapq
 import logging
-from typing import Any, Dict, Optional
+from itertools import islice
+from typing import Any, Dict, List, Optional
 
 from fastapi import HTTPException
+from domains.calendars import cache as calendar_cache
 from domains.calendars.repository import CalendarRepository
 from domains.calendars.providers.google import (
     GoogleCalendarAPIError,
@@ -15,11 +19,45 @@ from domains.calendars.providers.google import (
 
 logger = logging.getLogger(__name__)
 
+# Shared read-only fallback for missing nested event fields
+_EMPTY: Dict[str, Any] = {}
+
+
+def _format_event(
+    event: Dict[str, Any], calendar_id: str, calendar_name: str
+) -> Dict[str, Any]:
+    """Format a Google event into the agent search result shape."""
+    start = event.get("start") or _EMPTY
+    end = event.get("end") or _EMPTY
+    organizer = event.get("organizer")
+    return {
+        "event_id": event.get("id"),
+        "calendar_id": calendar_id,
+        "calendar_name": calendar_name,
+        "summary": event.get("summary", "No title"),
+        "description": event.get("description", ""),
+        "location": event.get("location", ""),
+        "start": start.get("dateTime") or start.get("date"),
+        "end": end.get("dateTime") or end.get("date"),
+        "attendees": [
+            {"email": att.get("email"), "displayName": att.get("displayName")}
+            for att in event.get("attendees") or ()
+        ],
+        "organizer": {
+            "email": organizer.get("email"),
+            "displayName": organizer.get("displayName"),
+        } if organizer else None,
+    }
+
+
+def _start_sort_key(event: Dict[str, Any]) -> str:
+    """Sort key for formatted events; events without a start sort first."""
+    return event["start"] or ""
+
 
 def get_calendar_wrapper_for_user(user_id: str) -> GoogleCalendarWrapper:
     """Get a GoogleCalendarWrapper instance for the user's first Google account."""
-    repository = CalendarRepository()
-    accounts = repository.get_accounts(user_id)
+    accounts = calendar_cache.get_accounts(user_id)
     if not accounts:
         raise HTTPException(
             status_code=400,
@@ -68,17 +106,26 @@ async def search_events_for_user(
     Returns:
         Dictionary containing search results with events list from all calendars
     """
+    # The account and calendar lookups are independent blocking Supabase
+    # calls, so run them concurrently in worker threads
+    if calendar_id:
+        _, calendar_is_visible = await asyncio.gather(
+            asyncio.to_thread(calendar_cache.get_accounts, user_id),
+            asyncio.to_thread(
+                CalendarRepository().calendar_visible, user_id, calendar_id
+            ),
+        )
+    else:
+        accounts, user_calendars = await asyncio.gather(
+            asyncio.to_thread(calendar_cache.get_accounts, user_id),
+            asyncio.to_thread(calendar_cache.get_calendars, user_id),
+        )
     wrapper = get_calendar_wrapper_for_user(user_id)
     
-    # Get user's calendars from Supabase (with hidden calendars filtered out)
-    repository = CalendarRepository()
-    user_calendars = repository.get_calendars(user_id)  # Default include_hidden=False filters hidden calendars
-    visible_calendar_ids = {cal["google_calendar_id"] for cal in user_calendars}
-    
     try:
         # If a specific calendar is requested, verify it's not hidden
         if calendar_id:
-            if calendar_id not in visible_calendar_ids:
+            if not calendar_is_visible:
                 return {
                     "status": "error",
                     "error": f"Calendar {calendar_id} not found or is hidden.",
@@ -87,80 +134,83 @@ async def search_events_for_user(
                 }
             calendars_to_search = [{"id": calendar_id}]
         else:
-            # Get all calendars from Google API, but filter to only visible ones
-            all_calendars = await wrapper.list_calendars(min_access_role="reader")
-            # Filter to only calendars that are visible (not hidden) in Supabase
+            # Search the visible calendars stored in Supabase for the wrapper's
+            # account, rather than listing them again from Google
+            account_id = accounts[0].get("id")
             calendars_to_search = [
-                cal for cal in all_calendars
-                if cal.get("id") in visible_calendar_ids
+                {
+                    "id": cal["google_calendar_id"],
+                    "summary": cal.get("name") or cal["google_calendar_id"],
+                }
+                for cal in user_calendars
+                if cal.get("google_account_id") == account_id
             ]
-        
-        # Search across all calendars
-        all_formatted_events = []
-        errors = []
+            if not calendars_to_search:
+                # Nothing visible to search; skip building the Google client
+                return {
+                    "status": "success",
+                    "count": 0,
+                    "events": [],
+                    "calendars_searched": 0,
+                }
         
         # Distribute max_results across calendars (roughly equal per calendar)
-        # But ensure we don't exceed the total max_results
-        per_calendar_max = max(10, max_results // max(1, len(calendars_to_search)))
-        
-        for calendar in calendars_to_search:
-            cal_id = calendar.get("id")
-            if not cal_id:
-                continue
-                
-            try:
-                result = await wrapper.search_events(
-                    query=query,
-                    calendar_id=cal_id,
-                    time_min=time_min,
-                    time_max=time_max,
-                    max_results=per_calendar_max,
+        # But never ask a single calendar for more than the total max_results
+        per_calendar_max = min(
+            max_results,
+            max(10, max_results // max(1, len(calendars_to_search))),
+        )
+
+        calendar_names = {
+            calendar["id"]: calendar.get("summary", calendar["id"])
+            for calendar in calendars_to_search
+            if calendar.get("id")
+        }
+
+        # One batch HTTP request searches every calendar at once
+        results = await wrapper.batch_search_events(
+            query=query,
+            calendar_ids=list(calendar_names),
+            time_min=time_min,
+            time_max=time_max,
+            max_results=per_calendar_max,
+        )
+
+        per_calendar_events: List[List[Dict[str, Any]]] = []
+        errors = []
+        for cal_id, result in results.items():
+            if isinstance(result, GoogleCalendarAPIError):
+                # Log error but continue with other calendars
+                logger.warning(
+                    "Calendar search error user_id=%s calendar=%s: %s",
+                    user_id,
+                    cal_id,
+                    result,
                 )
-                
-                # Format the response to include event details
-                events = result.get("items", [])
-                calendar_name = calendar.get("summary", cal_id)
-                
-                for event in events:
-                    all_formatted_events.append({
-                        "event_id": event.get("id"),
-                        "calendar_id": cal_id,
-                        "calendar_name": calendar_name,
-                        "summary": event.get("summary", "No title"),
-                        "description": event.get("description", ""),
-                        "location": event.get("location", ""),
-                        "start": event.get("start", {}).get("dateTime") or event.get("start", {}).get("date"),
-                        "end": event.get("end", {}).get("dateTime") or event.get("end", {}).get("date"),
-                        "attendees": [
-                            {
-                                "email": att.get("email"),
-                                "displayName": att.get("displayName"),
-                            }
-                            for att in event.get("attendees", [])
-                        ],
-                        "organizer": {
-                            "email": event.get("organizer", {}).get("email"),
-                            "displayName": event.get("organizer", {}).get("displayName"),
-                        } if event.get("organizer") else None,
-                    })
-                    
-            except GoogleCalendarAPIError as e:
-                # Log error but continue searching other calendars
-                error_msg = f"Error searching calendar {cal_id}: {str(e)}"
-                logger.warning(f"Calendar search error user_id={user_id} calendar={cal_id}: {str(e)}")
-                errors.append(error_msg)
+                errors.append(f"Error searching calendar {cal_id}: {str(result)}")
                 continue
-        
-        # Sort events by start time (earliest first)
-        all_formatted_events.sort(
-            key=lambda x: x.get("start", ""),
-            reverse=False
+
+            # Format the response to include event details
+            calendar_name = calendar_names.get(cal_id, cal_id)
+            formatted = [
+                _format_event(event, cal_id, calendar_name)
+                for event in result.get("items") or ()
+            ]
+            # Sort by the raw ISO start string (lexical, like the combined
+            # sort this replaces, so mixed UTC offsets aren't chronological);
+            # heapq.merge needs each stream ordered by that same key
+            formatted.sort(key=_start_sort_key)
+            per_calendar_events.append(formatted)
+
+        # Interleave the sorted per-calendar streams by start time (earliest
+        # first), stopping once max_results have been taken
+        all_formatted_events = list(
+            islice(
+                heapq.merge(*per_calendar_events, key=_start_sort_key),
+                max_results,
+            )
         )
         
-        # Limit to max_results
-        if len(all_formatted_events) > max_results:
-            all_formatted_events = all_formatted_events[:max_results]
-        
         response = {
             "status": "success",
             "count": len(all_formatted_events),
@@ -175,7 +225,7 @@ async def search_events_for_user(
         return response
         
     except GoogleCalendarAPIError as e:
-        logger.error(f"Failed to search events user_id={user_id}: {e}")
+        logger.error("Failed to search events user_id=%s: %s", user_id, e)
         return {
             "status": "error",
             "error": str(e),
@@ -184,7 +234,9 @@ async def search_events_for_user(
         }
     except Exception as e:
         logger.error(
-            f"Unexpected error searching events user_id={user_id}: {e}",
+            "Unexpected error searching events user_id=%s: %s",
+            user_id,
+            e,
             exc_info=True,
         )
         return {